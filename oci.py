@@ -7,40 +7,94 @@ temporary failures like OCI "Out of host capacity" errors.
 """
 
 import argparse
+import asyncio
+import atexit
+import contextlib
+import json
 import logging
+import mmap
+import os
+import queue
+import random
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from logging.handlers import RotatingFileHandler
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import IO, NamedTuple
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+_AD_LINE_RE = re.compile(rb'availability_domain\s*=\s*"([^"]*)"')
+# Terraform errors that indicate a temporary failure worth retrying. A bare
+# "try again" is deliberately not matched: terraform's state lock and config
+# errors end with "Please resolve the issue above and try again".
+_RECOVERABLE_RE = re.compile(
+    rb'out\s+of\s+host\s+capacity|internalerror|toomanyrequests|throttl\w*'
+    rb'|try\s+again\s+later',
+    re.IGNORECASE,
+)
+
+# Background thread writing log records to the console and log file
+_log_listener: QueueListener | None = None
+_console_handler: logging.Handler | None = None
+
+# Number of trailing output lines kept from each terraform stream
+OUTPUT_TAIL_LINES = 1000
+# Number of trailing output bytes decoded when logging terraform output
+OUTPUT_LOG_BYTES = 64 * 1024
+# Number of trailing error output bytes logged outside of DEBUG
+OUTPUT_SUMMARY_BYTES = 4 * 1024
+
+
+class TerraformResult(NamedTuple):
+    returncode: int | None
+    stdout: bytes
+    stderr: bytes
+    recoverable_error: bool
 
 
 class ColorFilterHandler(RotatingFileHandler):
     def emit(self, record):
-        if hasattr(record, 'msg') and isinstance(record.msg, str):
-            record.msg = re.sub(r'\x1b\[[0-9;]*m', '', record.msg)
-        if hasattr(record, 'args') and record.args:
+        if isinstance(record.msg, str) and '\x1b' in record.msg:
+            record.msg = _ANSI_RE.sub('', record.msg)
+        if isinstance(record.args, tuple) and any(
+            isinstance(arg, str) and '\x1b' in arg for arg in record.args
+        ):
             record.args = tuple(
-                re.sub(r'\x1b\[[0-9;]*m', '', str(arg)) if isinstance(arg, str) else arg
+                _ANSI_RE.sub('', arg) if isinstance(arg, str) else arg
                 for arg in record.args
             )
         super().emit(record)
 
 
 def setup_logging(log_file: str = 'terraform_retry.log', log_level: int = logging.INFO):
-    """Set up logging to both console and rotating file."""
+    """
+    Set up logging to both console and rotating file.
+
+    Records are handed to a background QueueListener so that callers only pay
+    for an enqueue. Repeated calls reuse the existing handlers: they update
+    the log level, but the log file of the first call stays in use.
+    """
+    global _log_listener, _console_handler  # noqa: PLW0603
+
     logger = logging.getLogger(__name__)
     logger.setLevel(log_level)
 
-    logger.handlers.clear()
+    if _log_listener is not None and _console_handler is not None:
+        _console_handler.setLevel(log_level)
+        return logger
 
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    _console_handler = console_handler
 
     logs_dir = Path.cwd() / 'logs'
     logs_dir.mkdir(exist_ok=True)
@@ -52,7 +106,16 @@ def setup_logging(log_file: str = 'terraform_retry.log', log_level: int = loggin
     )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.handlers.clear()
+    logger.addHandler(QueueHandler(log_queue))
+
+    _log_listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
     return logger
 
@@ -62,12 +125,14 @@ def run_terraform_apply(  # noqa: PLR0913, PLR0915, PLR0912, PLR0911
     max_attempts: int = 50,
     retry_delay: int = 30,
     *,
+    retry_cap: int = 600,
     auto_approve: bool = True,
     availability_domains: list[str],
     logger: logging.Logger,
     timeout: int = 1800,
     no_cleanup: bool = False,
     plan_only: bool = False,
+    parallelism: int = 1,
 ) -> bool:
     """
     Run terraform apply repeatedly until it succeeds.
@@ -76,13 +141,15 @@ def run_terraform_apply(  # noqa: PLR0913, PLR0915, PLR0912, PLR0911
     Args:
         config_dir: Directory containing terraform configuration
         max_attempts: Maximum number of attempts
-        retry_delay: Delay between retries in seconds
+        retry_delay: Initial delay between retries in seconds
+        retry_cap: Maximum delay between retries in seconds
         auto_approve: Whether to auto-approve terraform apply
         availability_domains: List of availability domains to cycle through
         logger: Logger instance
         timeout: Timeout for terraform operations in seconds
         no_cleanup: Whether to skip resource cleanup on failure
         plan_only: Whether to run terraform plan instead of apply
+        parallelism: Number of availability domains to attempt concurrently
 
 
     Returns:
@@ -97,7 +164,26 @@ def run_terraform_apply(  # noqa: PLR0913, PLR0915, PLR0912, PLR0911
     if auto_approve and not plan_only:
         cmd.append('-auto-approve')
 
+    if parallelism > 1 and not plan_only:
+        return asyncio.run(
+            run_terraform_apply_parallel(
+                config_dir,
+                cmd,
+                max_attempts,
+                retry_delay,
+                retry_cap=retry_cap,
+                parallelism=parallelism,
+                auto_approve=auto_approve,
+                availability_domains=availability_domains,
+                logger=logger,
+                timeout=timeout,
+                no_cleanup=no_cleanup,
+            )
+        )
+
     attempt = 1
+    last_written_ad: str | None = None
+    prev_delay: float = retry_delay
 
     while attempt <= max_attempts:
         # Cycle through regions and ADs based on attempt number
@@ -112,32 +198,27 @@ def run_terraform_apply(  # noqa: PLR0913, PLR0915, PLR0912, PLR0911
         )
 
         # Update main.tf with current availability domain
-        update_main_tf(config_dir, current_ad, logger)
+        if current_ad != last_written_ad:
+            update_main_tf(config_dir, current_ad, logger)
+            last_written_ad = current_ad
 
         logger.info('Running %s', cmd)
 
         try:
-            result = subprocess.run(  # noqa: S603
-                cmd,
-                check=False,
-                cwd=config_dir,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            result = run_terraform_command(cmd, config_dir, timeout)
 
             if result.returncode == 0:
                 operation = 'plan' if plan_only else 'apply'
                 logger.info('Terraform %s succeeded!', operation)
                 if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('Output:\n%s', result.stdout)
+                    logger.debug('Output:\n%s', decode_output(result.stdout))
                 return True
             operation = 'plan' if plan_only else 'apply'
             logger.warning(
                 'Terraform %s failed (exit code: %d)', operation, result.returncode
             )
             if logger.isEnabledFor(logging.DEBUG):
-                logger.debug('Error output:\n%s', result.stderr)
+                logger.debug('Error output:\n%s', decode_output(result.stderr))
 
             # For plan-only mode, don't clean up or retry
             if plan_only:
@@ -148,17 +229,14 @@ def run_terraform_apply(  # noqa: PLR0913, PLR0915, PLR0912, PLR0911
                 cleanup_resources(config_dir, auto_approve=auto_approve, logger=logger)
 
             # Check for specific recoverable errors
-            error_output = result.stderr.lower()
-            if (
-                'out of host capacity' in error_output
-                or 'internalerror' in error_output
-            ):
+            if result.recoverable_error:
                 if attempt < max_attempts:
+                    prev_delay = next_retry_delay(prev_delay, retry_delay, retry_cap)
                     logger.info(
-                        'Detected recoverable error (host capacity). Retrying in %d seconds...',
-                        retry_delay,
+                        'Detected recoverable error. Retrying in %.1f seconds...',
+                        prev_delay,
                     )
-                    time.sleep(retry_delay)
+                    time.sleep(prev_delay)
                     attempt += 1
                     continue
                 logger.error(
@@ -170,6 +248,7 @@ def run_terraform_apply(  # noqa: PLR0913, PLR0915, PLR0912, PLR0911
 
         except subprocess.TimeoutExpired:
             logger.warning('Terraform apply timed out. Retrying...')
+            prev_delay = retry_delay
             attempt += 1
             continue
 
@@ -191,16 +270,438 @@ def run_terraform_apply(  # noqa: PLR0913, PLR0915, PLR0912, PLR0911
     return False
 
 
+def run_terraform_command(cmd: list[str], cwd: Path, timeout: int) -> TerraformResult:
+    """
+    Run a terraform command, streaming its output instead of buffering it.
+
+    Only the last OUTPUT_TAIL_LINES lines of stdout and stderr are kept.
+    Stderr is scanned as it arrives, and the command is terminated as soon
+    as a recoverable error shows up rather than waiting for it to give up.
+
+    Args:
+        cmd: Terraform command to run
+        cwd: Directory to run the command in
+        timeout: Timeout for the command in seconds
+
+    Returns:
+        TerraformResult with the exit code and output tails
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time
+
+    """
+    recoverable = threading.Event()
+    stdout_tail: deque[bytes] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: deque[bytes] = deque(maxlen=OUTPUT_TAIL_LINES)
+
+    proc = subprocess.Popen(  # noqa: S603
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    def drain(stream: IO[bytes], tail: deque[bytes], *, scan: bool) -> None:
+        for line in stream:
+            tail.append(line)
+            if scan and not recoverable.is_set() and is_recoverable_error(line):
+                recoverable.set()
+                proc.terminate()
+
+    threads = [
+        threading.Thread(
+            target=drain, args=(proc.stdout, stdout_tail), kwargs={'scan': False}
+        ),
+        threading.Thread(
+            target=drain, args=(proc.stderr, stderr_tail), kwargs={'scan': True}
+        ),
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+
+    for thread in threads:
+        thread.join()
+
+    # Also catch error signatures split across several lines
+    stderr = b''.join(stderr_tail)
+    return TerraformResult(
+        proc.returncode,
+        b''.join(stdout_tail),
+        stderr,
+        recoverable.is_set() or is_recoverable_error(stderr),
+    )
+
+
+def next_retry_delay(prev_delay: float, retry_delay: int, retry_cap: int) -> float:
+    """
+    Pick the next retry delay using exponential backoff with decorrelated jitter.
+
+    Args:
+        prev_delay: Delay used for the previous retry in seconds
+        retry_delay: Minimum delay in seconds
+        retry_cap: Maximum delay in seconds
+
+    Returns:
+        Delay to wait before the next retry in seconds
+
+    """
+    return min(retry_cap, random.uniform(retry_delay, prev_delay * 3))  # noqa: S311
+
+
+def is_recoverable_error(stderr: bytes) -> bool:
+    """Check if terraform error output indicates a temporary capacity failure."""
+    return _RECOVERABLE_RE.search(stderr) is not None
+
+
+def decode_output(output: bytes, limit: int = OUTPUT_LOG_BYTES) -> str:
+    """Decode the last limit bytes of terraform output for logging."""
+    return output[-limit:].decode('utf-8', 'replace')
+
+
+async def run_terraform_apply_parallel(  # noqa: PLR0913, PLR0915, PLR0912
+    config_dir: Path,
+    cmd: list[str],
+    max_attempts: int,
+    retry_delay: int,
+    *,
+    retry_cap: int,
+    parallelism: int,
+    auto_approve: bool,
+    availability_domains: list[str],
+    logger: logging.Logger,
+    timeout: int,  # noqa: ASYNC109 - forwarded to each terraform attempt
+    no_cleanup: bool,
+) -> bool:
+    """
+    Run terraform apply against several availability domains concurrently.
+
+    Each attempt runs in its own scratch copy of config_dir, with at most one
+    attempt in flight per availability domain. The first successful attempt
+    wins: the remaining attempts are terminated and their resources destroyed,
+    and the winner's state is copied back into config_dir.
+
+    Args:
+        config_dir: Directory containing terraform configuration
+        cmd: Terraform command to run for each attempt
+        max_attempts: Maximum number of attempts across all domains
+        retry_delay: Initial delay before retrying a domain in seconds
+        retry_cap: Maximum delay before retrying a domain in seconds
+        parallelism: Maximum number of concurrent attempts
+        auto_approve: Whether to auto-approve terraform destroy
+        availability_domains: List of availability domains to attempt
+        logger: Logger instance
+        timeout: Timeout for terraform operations in seconds
+        no_cleanup: Whether to skip resource cleanup on failure
+
+    Returns:
+        True if an attempt succeeded, False otherwise
+
+    """
+    slots = min(parallelism, len(availability_domains))
+    # Domains ready to be submitted, with the delay to wait before starting
+    idle: deque[tuple[str, float]] = deque((ad, 0) for ad in availability_domains)
+    # Last backoff delay used for each domain
+    prev_delays: dict[str, float] = {}
+    pending: dict[asyncio.Task, tuple[str, Path]] = {}
+    # Destroys of finished attempts, run alongside the remaining attempts
+    cleanups: set[asyncio.Task] = set()
+    attempt = 0
+
+    def discard(workdir: Path) -> None:
+        cleanups.add(
+            asyncio.create_task(
+                discard_workdir(
+                    workdir,
+                    auto_approve=auto_approve,
+                    logger=logger,
+                    no_cleanup=no_cleanup,
+                )
+            )
+        )
+
+    logger.info('Running %s across up to %d availability domains', cmd, slots)
+
+    try:
+        while True:
+            while idle and len(pending) < slots and attempt < max_attempts:
+                current_ad, delay = idle.popleft()
+                attempt += 1
+                workdir = create_workdir(config_dir)
+                update_main_tf(workdir, current_ad, logger)
+                logger.info(
+                    'Attempt %d/%d: Using AD %s (workdir: %s)',
+                    attempt,
+                    max_attempts,
+                    current_ad,
+                    workdir,
+                )
+                task = asyncio.create_task(
+                    run_terraform_attempt(cmd, workdir, delay=delay, timeout=timeout)
+                )
+                pending[task] = (current_ad, workdir)
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                current_ad, workdir = pending.pop(task)
+                try:
+                    result = task.result()
+                except Exception:
+                    logger.exception('Unexpected error running terraform apply:')
+                    discard(workdir)
+                    return False
+
+                if result.returncode == 0:
+                    logger.info('Terraform apply succeeded in AD %s!', current_ad)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug('Output:\n%s', decode_output(result.stdout))
+                    adopt_workdir_state(workdir, config_dir, current_ad, logger)
+                    shutil.rmtree(workdir, ignore_errors=True)
+                    return True
+
+                discard(workdir)
+
+                if result.returncode is None:
+                    logger.warning(
+                        'Terraform apply timed out in AD %s. Retrying...', current_ad
+                    )
+                    prev_delays.pop(current_ad, None)
+                    idle.append((current_ad, 0))
+                    continue
+
+                logger.warning(
+                    'Terraform apply failed in AD %s (exit code: %d)',
+                    current_ad,
+                    result.returncode,
+                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('Error output:\n%s', decode_output(result.stderr))
+
+                if not result.recoverable_error:
+                    logger.error('Non-recoverable error detected. Stopping retries.')
+                    return False
+
+                delay = next_retry_delay(
+                    prev_delays.get(current_ad, retry_delay), retry_delay, retry_cap
+                )
+                prev_delays[current_ad] = delay
+                logger.info(
+                    'Detected recoverable error in AD %s. Retrying in %.1f seconds...',
+                    current_ad,
+                    delay,
+                )
+                idle.append((current_ad, delay))
+
+        logger.error('Maximum attempts (%d) exceeded.', max_attempts)
+        return False
+
+    finally:
+        # Terminate any attempts still in flight and clean up after them
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for _, workdir in pending.values():
+            discard(workdir)
+        await asyncio.gather(*cleanups)
+
+
+def create_workdir(config_dir: Path) -> Path:
+    """
+    Create a scratch copy of config_dir for a single parallel attempt.
+
+    The .terraform directory is symlinked rather than copied so providers are
+    shared between attempts, and existing state is left out so each attempt
+    only ever destroys the resources it created itself.
+    """
+    workdir = Path(tempfile.mkdtemp(prefix='oci-attempt-'))
+    shutil.copytree(
+        config_dir,
+        workdir,
+        ignore=shutil.ignore_patterns('.terraform', 'terraform.tfstate*'),
+        dirs_exist_ok=True,
+    )
+    terraform_dir = config_dir / '.terraform'
+    if terraform_dir.exists():
+        (workdir / '.terraform').symlink_to(terraform_dir, target_is_directory=True)
+    return workdir
+
+
+async def run_terraform_attempt(
+    cmd: list[str],
+    workdir: Path,
+    *,
+    delay: float,
+    timeout: int,  # noqa: ASYNC109 - the attempt terminates terraform itself on timeout
+) -> TerraformResult:
+    """
+    Run a single terraform attempt in workdir after waiting delay seconds.
+
+    Output is streamed the same way as run_terraform_command. The exit code
+    of the returned result is None if the attempt timed out.
+    """
+    if delay:
+        await asyncio.sleep(delay)
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=workdir,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=1024 * 1024,
+    )
+    recoverable = False
+    stdout_tail: deque[bytes] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: deque[bytes] = deque(maxlen=OUTPUT_TAIL_LINES)
+
+    async def drain(
+        stream: asyncio.StreamReader, tail: deque[bytes], *, scan: bool
+    ) -> None:
+        nonlocal recoverable
+        async for line in stream:
+            tail.append(line)
+            if scan and not recoverable and is_recoverable_error(line):
+                recoverable = True
+                proc.terminate()
+
+    async def communicate() -> None:
+        assert proc.stdout is not None  # noqa: S101
+        assert proc.stderr is not None  # noqa: S101
+        await asyncio.gather(
+            drain(proc.stdout, stdout_tail, scan=False),
+            drain(proc.stderr, stderr_tail, scan=True),
+        )
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(communicate(), timeout)
+    except (TimeoutError, asyncio.CancelledError) as e:
+        # Let terraform stop gracefully so it records any partial state
+        with contextlib.suppress(ProcessLookupError):
+            proc.terminate()
+        await proc.wait()
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        return TerraformResult(None, b'', b'', recoverable_error=False)
+
+    # Also catch error signatures split across several lines
+    stderr = b''.join(stderr_tail)
+    return TerraformResult(
+        proc.returncode,
+        b''.join(stdout_tail),
+        stderr,
+        recoverable or is_recoverable_error(stderr),
+    )
+
+
+async def discard_workdir(
+    workdir: Path, *, auto_approve: bool, logger: logging.Logger, no_cleanup: bool
+) -> None:
+    """Destroy the resources created in a scratch workdir and remove it."""
+    if no_cleanup:
+        logger.info('Keeping workdir %s (cleanup disabled)', workdir)
+        return
+    destroyed = await asyncio.to_thread(
+        cleanup_resources, workdir, auto_approve=auto_approve, logger=logger
+    )
+    if not destroyed:
+        # The workdir holds the only state tracking these resources
+        logger.error(
+            'Keeping workdir %s so its resources can be destroyed manually', workdir
+        )
+        return
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+def adopt_workdir_state(
+    workdir: Path, config_dir: Path, availability_domain: str, logger: logging.Logger
+) -> None:
+    """Copy the terraform state of a successful attempt back into config_dir."""
+    for state_file in workdir.glob('terraform.tfstate*'):
+        shutil.copy2(state_file, config_dir / state_file.name)
+    update_main_tf(config_dir, availability_domain, logger)
+    logger.info('Copied terraform state from %s to %s', workdir, config_dir)
+
+
+def has_terraform_state(config_dir: Path) -> bool:
+    """Check if terraform.tfstate in config_dir tracks any resources."""
+    state_file = config_dir / 'terraform.tfstate'
+    if not state_file.exists() or state_file.stat().st_size == 0:
+        return False
+
+    try:
+        state = json.loads(state_file.read_bytes())
+    except ValueError:
+        # Treat unreadable state as non-empty rather than risk discarding it
+        return True
+    return bool(state.get('resources'))
+
+
 def check_availability_domain_in_tfvars(config_dir: Path) -> bool:
     """Check if availability_domain is set in terraform.tfvars."""
     tfvars_file = config_dir / 'terraform.tfvars'
     if not tfvars_file.exists():
         return False
 
-    content = tfvars_file.read_text()
     # Look for availability_domain = "non-empty-value"
-    match = re.search(r'availability_domain\s*=\s*"([^"]*)"', content)
-    return match is not None and match.group(1).strip() != ''
+    current_ad = read_availability_domain(tfvars_file)
+    return current_ad is not None and current_ad.strip() != ''
+
+
+def read_availability_domain(tf_file: Path) -> str | None:
+    """Read the quoted availability_domain value from a terraform file."""
+    with tf_file.open('rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _AD_LINE_RE.search(mm)
+            return match.group(1).decode() if match else None
+
+
+def write_availability_domain(tf_file: Path, availability_domain: str) -> bool:
+    """
+    Set the quoted availability_domain values in a terraform file.
+
+    Nothing is written when every value already matches. Otherwise values
+    are overwritten in place through a memory map when the new value has the
+    same length as the old one, and the file is rewritten when it does not.
+
+    Returns:
+        True if an availability_domain line was found
+
+    """
+    new_value = availability_domain.encode()
+    with tf_file.open('r+b') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0) as mm:
+            spans = [match.span(1) for match in _AD_LINE_RE.finditer(mm)]
+            if not spans:
+                return False
+            if all(mm[start:end] == new_value for start, end in spans):
+                return True
+            if all(end - start == len(new_value) for start, end in spans):
+                for start, end in spans:
+                    mm[start:end] = new_value
+                mm.flush()
+                return True
+
+    content = tf_file.read_bytes()
+    tf_file.write_bytes(
+        _AD_LINE_RE.sub(
+            lambda _: b'availability_domain = "' + new_value + b'"', content
+        )
+    )
+    return True
 
 
 def update_main_tf(
@@ -212,15 +713,8 @@ def update_main_tf(
     # Try to update terraform.tfvars first
     tfvars_file = config_dir / 'terraform.tfvars'
     if tfvars_file.exists():
-        content = tfvars_file.read_text()
         # Replace the availability_domain line in terraform.tfvars
-        updated_content = re.sub(
-            r'availability_domain\s*=\s*"[^"]*"',
-            f'availability_domain = "{availability_domain}"',
-            content,
-        )
-        if updated_content != content:
-            tfvars_file.write_text(updated_content)
+        if write_availability_domain(tfvars_file, availability_domain):
             logger.info(
                 'Updated terraform.tfvars with availability domain: %s',
                 availability_domain,
@@ -236,15 +730,8 @@ def update_main_tf(
         logger.warning('main.tf not found, skipping AD update')
         return
 
-    content = main_tf_file.read_text()
     # Replace the availability_domain line
-    updated_content = re.sub(
-        r'availability_domain\s*=\s*"[^"]*"',
-        f'availability_domain = "{availability_domain}"',
-        content,
-    )
-    if updated_content != content:
-        main_tf_file.write_text(updated_content)
+    if write_availability_domain(main_tf_file, availability_domain):
         logger.info('Updated main.tf with availability domain: %s', availability_domain)
     else:
         logger.warning('Could not find availability_domain line in main.tf to update')
@@ -252,7 +739,7 @@ def update_main_tf(
 
 def cleanup_resources(
     config_dir: Path, *, auto_approve: bool, logger: logging.Logger
-) -> None:
+) -> bool:
     """
     Clean up all terraform resources by running terraform destroy.
 
@@ -261,6 +748,9 @@ def cleanup_resources(
         auto_approve: Whether to auto-approve terraform destroy
         logger: Logger instance
 
+    Returns:
+        True if terraform destroy succeeded, False otherwise
+
     """
     logger.info('Running terraform destroy to clean up all resources...')
 
@@ -274,23 +764,38 @@ def cleanup_resources(
             check=False,
             cwd=config_dir,
             capture_output=True,
-            text=True,
             timeout=1800,
         )
 
         if result.returncode == 0:
             logger.info('Successfully cleaned up all resources')
-            logger.info('Destroy output:\n%s', result.stdout)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Destroy output:\n%s', decode_output(result.stdout))
         else:
             logger.error(
                 'Failed to clean up resources (exit code: %d)', result.returncode
             )
-            logger.error('Destroy error output:\n%s', result.stderr)
+            logger.error(
+                'Destroy error output:\n%s',
+                decode_output(result.stderr, OUTPUT_SUMMARY_BYTES),
+            )
+            if (
+                logger.isEnabledFor(logging.DEBUG)
+                and len(result.stderr) > OUTPUT_SUMMARY_BYTES
+            ):
+                logger.debug(
+                    'Full destroy error output:\n%s',
+                    result.stderr.decode('utf-8', 'replace'),
+                )
 
     except subprocess.TimeoutExpired:
         logger.exception('Terraform destroy timed out')
     except Exception:
         logger.exception('Unexpected error during resource cleanup:')
+    else:
+        return result.returncode == 0
+
+    return False
 
 
 def main():  # noqa: PLR0915
@@ -316,7 +821,14 @@ def main():  # noqa: PLR0915
         type=int,
         default=30,
         metavar='SECONDS',
-        help='Delay between retries in seconds (default: 30)',
+        help='Initial delay between retries in seconds (default: 30)',
+    )
+    parser.add_argument(
+        '--retry-cap',
+        type=int,
+        default=600,
+        metavar='SECONDS',
+        help='Maximum delay between retries in seconds (default: 600)',
     )
     parser.add_argument(
         '--no-auto-approve',
@@ -358,6 +870,13 @@ def main():  # noqa: PLR0915
         action='store_true',
         help='Increase log output (show terraform stdout/stderr)',
     )
+    parser.add_argument(
+        '--parallelism',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of availability domains to attempt concurrently (default: 1)',
+    )
     parser.add_argument(
         '--plan-only',
         action='store_true',
@@ -369,6 +888,10 @@ def main():  # noqa: PLR0915
     # Handle conflicting verbosity options
     if args.quiet and args.verbose:
         parser.error('--quiet and --verbose cannot be used together')
+    if args.parallelism < 1:
+        parser.error('--parallelism must be at least 1')
+    if args.parallelism > 1 and args.no_auto_approve:
+        parser.error('--parallelism cannot be used with --no-auto-approve')
 
     # Set up logging with appropriate level
     log_level = (
@@ -384,9 +907,20 @@ def main():  # noqa: PLR0915
     logger.info('Config directory: %s', config_dir)
     logger.info('Max attempts: %d', args.max_attempts)
     logger.info('Retry delay: %d seconds', args.retry_delay)
+    logger.info('Retry cap: %d seconds', args.retry_cap)
     logger.info('Auto approve: %s', auto_approve)
+    logger.info('Parallelism: %d', args.parallelism)
     logger.info('Availability domains: %s', args.availability_domains)
 
+    if args.parallelism > 1 and not args.plan_only and has_terraform_state(config_dir):
+        logger.error(
+            '--parallelism cannot be used when terraform.tfstate already tracks resources'
+        )
+        logger.error(
+            'Parallel attempts start from empty state, so existing resources would be orphaned'
+        )
+        sys.exit(1)
+
     # Check if availability_domain is set in terraform.tfvars
     ad_in_tfvars = check_availability_domain_in_tfvars(config_dir)
 
@@ -411,11 +945,8 @@ def main():  # noqa: PLR0915
             'No --availability-domains provided, using existing availability_domain from terraform.tfvars'
         )
         # Read the current value from terraform.tfvars
-        tfvars_file = config_dir / 'terraform.tfvars'
-        content = tfvars_file.read_text()
-        match = re.search(r'availability_domain\s*=\s*"([^"]*)"', content)
-        if match:
-            current_ad = match.group(1)
+        current_ad = read_availability_domain(config_dir / 'terraform.tfvars')
+        if current_ad is not None:
             availability_domains = [current_ad]
             logger.info(
                 'Using availability domain from terraform.tfvars: %s', current_ad
@@ -428,12 +959,14 @@ def main():  # noqa: PLR0915
         config_dir=config_dir,
         max_attempts=args.max_attempts,
         retry_delay=args.retry_delay,
+        retry_cap=args.retry_cap,
         auto_approve=auto_approve,
         availability_domains=availability_domains,
         logger=logger,
         timeout=args.timeout,
         no_cleanup=args.no_cleanup,
         plan_only=args.plan_only,
+        parallelism=args.parallelism,
     )
 
     if success: